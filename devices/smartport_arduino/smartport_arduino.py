@@ -1,5 +1,6 @@
 import serial
 from devices.vehicle import Vehicle
+from server.profiler import span
 
 class SmartPortArduino(Vehicle):
     """
@@ -57,6 +58,7 @@ class SmartPortArduino(Vehicle):
 
         return byte1, byte2
 
+    @span("smartport_arduino.control")
     def control(self, controller, command_deck):
         """
         Constructs and transmits a packet containing the state of all controllers
@@ -71,6 +73,7 @@ class SmartPortArduino(Vehicle):
         packet.append(255)
         self.send_and_receive_packet(packet)
 
+    @span("smartport_arduino.send_and_receive_packet")
     def send_and_receive_packet(self, packet):
         """
         Sends a packet via serial and processes any incoming response.
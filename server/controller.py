@@ -1,4 +1,5 @@
 import time
+from server.profiler import span
 
 class Controller:
     """
@@ -31,6 +32,7 @@ class Controller:
         self.last_activity = time.time()
         self.logger = logger
 
+    @span("controller.cycle_vehicle_select")
     def cycle_vehicle_select(self, delta):
         """
         Cycles through available vehicles.
@@ -54,6 +56,7 @@ class Controller:
                 self.selection = new_selection
                 return      
 
+    @span("controller.handle_input")
     def handle_input(self, input):
         """
         Processes input from a gamepad and updates controller state.
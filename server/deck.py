@@ -1,6 +1,7 @@
 import time
 from devices.vehicle import Vehicle
 from server.controller import Controller
+from server.profiler import span
 
 class VirtualCommandDeck:
     """
@@ -48,6 +49,7 @@ class VirtualCommandDeck:
         for controller_id in range(1, self.controller_count + 1):
             self.controllers[controller_id] = Controller(self, controller_id, self.logger)
 
+    @span("deck.assign_controller")
     def assign_controller(self, player_id):
         """
         Assigns an available controller to a client session.
@@ -67,6 +69,7 @@ class VirtualCommandDeck:
         self.logger.warning(f"No controller available for player {player_id}")
         return None
 
+    @span("deck.release_controller")
     def release_controller(self, player_id):
         """
         Releases the controller associated with a client session.
@@ -85,6 +88,7 @@ class VirtualCommandDeck:
                 return controller
         return None
 
+    @span("deck.get_controller")
     def get_controller(self, player_id):
         """
         Retrieves the controller associated with a client session.
@@ -100,6 +104,7 @@ class VirtualCommandDeck:
                 return controller
         return None
 
+    @span("deck.get_vehicle")
     def get_vehicle(self, vehicle_id=None):
         """
         Retrieves a vehicle by its ID.
@@ -115,6 +120,7 @@ class VirtualCommandDeck:
                 return vehicle
         return None
 
+    @span("deck.get_players")
     def get_players(self):
         """
         Retrieves data about all connected players and times out selections if needed.
@@ -1,7 +1,9 @@
+import hmac
 import os
 
-from flask import Flask, request, send_from_directory, render_template
+from flask import Flask, request, send_from_directory, render_template, abort, Response, jsonify
 from flask_socketio import SocketIO
+from server.profiler import Profiler, span
 
 def init_webserver(bundle_dir, config, command_deck, server_name):
     flask_dir = os.path.join(bundle_dir, "server", "web")
@@ -42,25 +44,63 @@ def init_webserver(bundle_dir, config, command_deck, server_name):
         """
         return send_from_directory(flask_dir, 'player.css')
 
+    @flask.route('/admin/profile')
+    def profile():
+        """
+        Samples the running server for the requested number of seconds.
+
+        Requires the X-Admin-Token header to match the configured admin token,
+        and is disabled when no token is configured. Passing format=json returns
+        the stacks together with the tracing span timings.
+
+        Returns:
+            Response: Collapsed stack lines for flamegraph tools, or a JSON object
+                with 'stacks' and 'spans' keys.
+        """
+        admin_token = config.get('admin', 'token', fallback='')
+        if not admin_token:
+            abort(404)
+        if not hmac.compare_digest(request.headers.get('X-Admin-Token', '').encode('utf-8'), admin_token.encode('utf-8')):
+            abort(403)
+
+        seconds = request.args.get('seconds', 10, type=float)
+        result = Profiler.profile(seconds, command_deck.logger)
+        if result is None:
+            abort(409, "A profile is already running")
+
+        stacks, spans = result
+        if request.args.get('format') == 'json':
+            return jsonify(stacks=stacks, spans=spans)
+        return Response(stacks, mimetype='text/plain')
+
     @socketio.on("connect")
-    def handle_connect():
+    @span("socketio.connect")
+    def handle_connect(auth=None):
         """
         Assigns a controller to the connecting player and broadcasts
         the updated player list to all clients.
+
+        Args:
+            auth (dict or None): Authentication data sent by the client (unused).
         """
         command_deck.assign_controller(request.sid) # pyright: ignore[reportAttributeAccessIssue]
         socketio.emit("players", {"players": command_deck.get_players()})
 
     @socketio.on("disconnect")
-    def handle_disconnect():
+    @span("socketio.disconnect")
+    def handle_disconnect(reason=None):
         """
         Releases the controller from the disconnecting player and broadcasts
         the updated player list to all clients.
+
+        Args:
+            reason (str or None): Disconnect reason sent by Socket.IO (unused).
         """
         command_deck.release_controller(request.sid) # pyright: ignore[reportAttributeAccessIssue]
         socketio.emit("players", {"players": command_deck.get_players()})
 
     @socketio.on("controller")
+    @span("socketio.controller")
     def handle_controller(data):
         """
         Updates the player name and processes controller input, then broadcasts
@@ -0,0 +1,136 @@
+import functools
+import sys
+import threading
+import time
+from collections import Counter
+
+class Profiler:
+    """
+    On-demand sampling profiler and tracing span recorder for the running server.
+
+    Samples the call stacks of all threads at a fixed interval and aggregates
+    them into collapsed stack lines compatible with flamegraph.pl and speedscope.
+    Tracing spans are only recorded while a profile is running and are returned
+    alongside the stacks.
+
+    Attributes:
+        active (bool): True while a profile is being captured.
+        max_seconds (int): Upper bound on the duration of a single profile.
+        interval (float): Time between stack samples in seconds.
+        spans (dict[str, list[float]]): Span name to [count, total, max] durations.
+    """
+
+    active = False
+    max_seconds = 60
+    interval = 0.01
+    spans = {}
+
+    _lock = threading.Lock()
+    _spans_lock = threading.Lock()
+
+    @classmethod
+    def profile(cls, seconds, logger):
+        """
+        Samples all threads for the given duration. Only one profile can run at a time.
+
+        Args:
+            seconds (float): Duration of the profile, clamped to max_seconds.
+            logger (Logger): Logger for profiler messages.
+
+        Returns:
+            tuple[str, dict] or None: Collapsed stack lines and a mapping of span
+                names to 'calls', 'avg_ms' and 'max_ms', or None if a profile is
+                already running.
+        """
+        if not cls._lock.acquire(blocking=False):
+            return None
+
+        try:
+            seconds = max(0.0, min(float(seconds), cls.max_seconds))
+            samples = Counter()
+            own_thread = threading.get_ident()
+            thread_names = {}
+            labels = {}
+
+            cls.spans = {}
+            cls.active = True
+            logger.info(f"Profiler - Sampling for {seconds} seconds")
+
+            end = time.monotonic() + seconds
+            while time.monotonic() < end:
+                for thread_id, frame in sys._current_frames().items():
+                    if thread_id == own_thread:
+                        continue
+                    if thread_id not in thread_names:
+                        thread_names = {t.ident: t.name for t in threading.enumerate()}
+                    stack = []
+                    while frame is not None:
+                        code = frame.f_code
+                        if code is _span_wrapper_code:
+                            frame = frame.f_back
+                            continue
+                        label = labels.get(code)
+                        if label is None:
+                            label = labels[code] = f"{code.co_qualname} ({code.co_filename}:{code.co_firstlineno})"
+                        stack.append(label)
+                        frame = frame.f_back
+                    stack.append(thread_names.get(thread_id, str(thread_id)))
+                    samples[";".join(reversed(stack))] += 1
+                time.sleep(cls.interval)
+        finally:
+            cls.active = False
+            cls._lock.release()
+
+        with cls._spans_lock:
+            spans = {name: tuple(stats) for name, stats in cls.spans.items()}
+
+        stacks = "".join(f"{stack} {count}\n" for stack, count in samples.items())
+        span_stats = {
+            name: {
+                "calls": count,
+                "avg_ms": round(total / count * 1000, 3),
+                "max_ms": round(longest * 1000, 3)
+            }
+            for name, (count, total, longest) in sorted(spans.items())
+        }
+        return stacks, span_stats
+
+    @classmethod
+    def record_span(cls, name, duration):
+        """
+        Adds a span duration to the running totals.
+
+        Args:
+            name (str): Span name.
+            duration (float): Span duration in seconds.
+        """
+        with cls._spans_lock:
+            stats = cls.spans.setdefault(name, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += duration
+            stats[2] = max(stats[2], duration)
+
+def span(name):
+    """
+    Decorator that times calls to a hot path as a named tracing span.
+
+    When no profile is running the wrapper only checks Profiler.active
+    before calling through.
+
+    Args:
+        name (str): Span name reported in the profile summary.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not Profiler.active:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                Profiler.record_span(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+_span_wrapper_code = span(None)(lambda: None).__code__